@@ -1,6 +1,15 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 import csv
+import functools
+import os
 import time
 import random
 import urllib.parse
@@ -8,10 +17,160 @@ from urllib.robotparser import RobotFileParser
 import re
 import logging
 
+# Optional: Bloom filter keeps visited-URL memory near-constant on very long
+# crawls (~1-2 bytes/URL vs ~200 for a set of str) at a tiny, tunable
+# false-positive rate; fall back to an exact set when unavailable
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+# Optional: selectolax wraps the C lexbor HTML5 parser, typically a few times
+# faster than lxml for plain text/attribute extraction; fall back to lxml
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Signs of common JavaScript frameworks, unioned into a single pattern so one
+# search call checks them all
+_JS_FRAMEWORK_RE = re.compile('|'.join([
+    r'react', r'vue', r'angular', r'next.js', r'nuxt',
+    r'data-react', r'ng-app', r'v-for',
+    r'\_\_NEXT_DATA\_\_', r'window.__NUXT__'
+]), re.I)
+
+# Signs of content that's likely loaded via JS
+_JS_CONTENT_RE = re.compile('|'.join([
+    r'<div id="app">\s*</div>',
+    r'<div id="root">\s*</div>',
+    r'getElementById\(.+?\)\.innerHTML',
+    r'document\.write\(',
+    r'display:\s*none;.+?[\'"]initial[\'"]'
+]), re.I)
+
+# Hrefs that are not crawlable pages (anchors, javascript, mailto, etc.);
+# str.startswith checks the whole tuple in one C call
+_SKIP_PREFIXES = ('#', 'javascript:', 'mailto:', 'tel:')
+
+
+def _lxml_root(html_content):
+    """Parse raw HTML into an lxml root element."""
+    try:
+        return lxml.html.fromstring(html_content)
+    except ValueError:
+        # str input carrying an XML encoding declaration (XHTML pages);
+        # lxml insists on parsing those from bytes
+        return lxml.html.fromstring(html_content.encode('utf-8', errors='replace'))
+
+
+def _extract_text(html_content):
+    """Extract all text content from raw HTML."""
+    if not html_content:
+        return ""
+
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html_content)
+        for node in tree.css('script,style,noscript,iframe,svg,img'):
+            node.decompose()
+        root = tree.root
+        if root is None:
+            return ""
+        # Take text from the whole document, not just the body, so head
+        # text like the title is kept - same as the lxml path below.
+        # Normalize whitespace (split/join collapses any whitespace run
+        # in C, no regex pass over the full text)
+        return ' '.join(root.text(separator=' ').split())
+
+    try:
+        root = _lxml_root(html_content)
+    except Exception as e:
+        logger.warning(f"Unable to parse page for text: {e}")
+        return ""
+
+    # Remove script and style elements in one C call instead of
+    # decomposing them one by one at the Python level
+    lxml.etree.strip_elements(root, 'script', 'style', 'noscript', 'iframe', 'svg', 'img', with_tail=False)
+
+    # itertext keeps words from adjacent elements separated, matching the
+    # selectolax path; text_content() would glue them together
+    return ' '.join(' '.join(root.itertext()).split())
+
+
+def _filter_links(hrefs, base_url, base_netloc):
+    """Normalize raw hrefs and keep only crawlable same-domain links."""
+    links = []
+    urljoin = urllib.parse.urljoin
+    urlparse = urllib.parse.urlparse
+
+    for href in hrefs:
+        # Skip empty hrefs, anchors, javascript, mailto, etc.
+        if not href or href.startswith(_SKIP_PREFIXES):
+            continue
+
+        full_url = href if href.startswith('http') else urljoin(base_url, href)
+        # Only include links within the same domain
+        if urlparse(full_url).netloc == base_netloc:
+            links.append(full_url)
+
+    return links
+
+
+def _extract_links(html_content, base_url, base_netloc):
+    """Extract all links on base_netloc from raw HTML."""
+    if not html_content:
+        return []
+
+    if LexborHTMLParser is not None:
+        hrefs = [node.attributes.get('href') for node in LexborHTMLParser(html_content).css('a[href]')]
+    else:
+        try:
+            root = _lxml_root(html_content)
+        except Exception as e:
+            logger.warning(f"Unable to parse page for links: {e}")
+            return []
+        # //a/@href keeps the traversal in C instead of walking a soup
+        hrefs = root.xpath('//a/@href')
+
+    return _filter_links(hrefs, base_url, base_netloc)
+
+
+def _parse_page(html_content, base_url, base_netloc):
+    """
+    Run the CPU-bound extraction for one page; returns (text, links).
+
+    Builds a single tree and pulls the links before pruning it for text, so
+    each page is parsed exactly once. Module-level (and fed only plain
+    strings) so it can run in a worker process.
+    """
+    if not html_content:
+        return "", []
+
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html_content)
+        hrefs = [node.attributes.get('href') for node in tree.css('a[href]')]
+        for node in tree.css('script,style,noscript,iframe,svg,img'):
+            node.decompose()
+        # Whole-document text so head/title content is kept, like the lxml path
+        root = tree.root
+        text = ' '.join(root.text(separator=' ').split()) if root is not None else ""
+    else:
+        try:
+            root = _lxml_root(html_content)
+        except Exception as e:
+            logger.warning(f"Unable to parse page: {e}")
+            return "", []
+        hrefs = root.xpath('//a/@href')
+        lxml.etree.strip_elements(root, 'script', 'style', 'noscript', 'iframe', 'svg', 'img', with_tail=False)
+        text = ' '.join(' '.join(root.itertext()).split())
+
+    return text, _filter_links(hrefs, base_url, base_netloc)
+
+
 class SmartWebScraper:
     def __init__(self, base_url: str, output_file: str = "scraped_data.csv", delay: tuple = (1, 3), respect_robots: bool = True) -> None:
         """
@@ -27,14 +186,35 @@ class SmartWebScraper:
         self.output_file = output_file
         self.delay = delay
         self.respect_robots = respect_robots
-        self.visited_urls = set()
-        self.queue = [base_url]
+        # same add/in API as a set, so the crawl loops don't care which
+        if ScalableBloomFilter is not None:
+            self.visited_urls = ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-4)
+        else:
+            self.visited_urls = set()
+        self.queue = deque([base_url])
+        self.queued = {base_url}  # mirrors queue contents for O(1) membership
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self._ua = self.headers['User-Agent']
 
-        # setup robot parser
+        # persistent session: keep-alive + pooled connections avoid a fresh
+        # TCP/TLS handshake per request on same-host crawls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update(self.headers)
+
+        # parse the base url once; is_same_domain runs per extracted link
         parsed_url = urllib.parse.urlparse(base_url)
+        self.base_netloc = parsed_url.netloc
+
+        # setup robot parser
         robots_txt_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
         self.robot_parser = RobotFileParser()
         self.robot_parser.set_url(robots_txt_url)
@@ -44,15 +224,23 @@ class SmartWebScraper:
             self.robot_parser_completed = True
         except Exception as e:
             logger.warning(f"Unable to read robots.txt file: {e}")
-        
+
+        # memoize robots.txt verdicts: the rules never change mid-crawl, and
+        # most URLs repeat the same handful of path prefixes
+        self._can_fetch_cached = functools.lru_cache(maxsize=4096)(self._robot_can_fetch)
+
         # lazily initialize selenium
         self.driver = None
         self.tried_selenium = False
 
-        # create output file with columns
-        with open(self.output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['URL', 'Content'])
+        # worker processes for the CPU-bound per-page parsing
+        self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+        # create output file with columns; keep the handle open so each page
+        # is one buffered writerow instead of an open/write/close cycle
+        self._csv_fh = open(self.output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+        self._csv_writer = csv.writer(self._csv_fh)
+        self._csv_writer.writerow(['URL', 'Content'])
 
     def initialize_selenium(self) -> bool:
         """ Initiate selenium headless browser if not already initialize """
@@ -68,6 +256,14 @@ class SmartWebScraper:
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument(f"user-agent={self.headers['User-Agent']}")
+            # Only the rendered text is kept, so skip images, stylesheets and
+            # fonts entirely and return at DOMContentLoaded instead of full load
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+            })
+            options.page_load_strategy = 'eager'
             self.driver = webdriver.Chrome(options=options)
             logger.info("Selenium initiated")
             return True
@@ -75,18 +271,38 @@ class SmartWebScraper:
             logger.error(f"Error initializing selenium: {e}")
             return False
         
+    def _robot_can_fetch(self, url: str) -> bool:
+        """ Walk the robots.txt rule list for url (uncached) """
+        return self.robot_parser.can_fetch(self._ua, url)
+
+    def render_with_selenium(self, url: str) -> str:
+        """ Load url in the headless browser and return the rendered source """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        self.driver.get(url)
+        # With the eager load strategy the empty SPA shell already has a
+        # body, so wait until the app has actually mounted some text (the
+        # same threshold detect_javascript_content uses), with a timeout
+        # fallback for pages that stay sparse
+        try:
+            WebDriverWait(self.driver, 10).until(
+                lambda d: len(d.find_element(By.TAG_NAME, 'body').text.strip()) >= 100)
+        except TimeoutException:
+            logger.warning(f"Timed out waiting for {url} to render, using current page state")
+        return self.driver.page_source
+
     def can_fetch(self, url: str) -> bool:
         """ Check if url can be fetched according to robots.txt """
         if not self.respect_robots:
             return True
-        
-        return self.robot_parser.can_fetch(self.headers['User-Agent'], url)
+
+        return self._can_fetch_cached(url)
 
     def is_same_domain(self, url: str) -> bool:
         """ Check if url is same domain as base url """
-        base_url_domain = urllib.parse.urlparse(self.base_url).netloc
-        url_domain = urllib.parse.urlparse(url).netloc
-        return base_url_domain == url_domain
+        return urllib.parse.urlparse(url).netloc == self.base_netloc
 
 
     def normalize_url(self, url: str) -> str:
@@ -95,188 +311,310 @@ class SmartWebScraper:
             return url
         return urllib.parse.urljoin(self.base_url, url)
     
-    def detect_javascript_content(self, html_content):
+    def detect_javascript_content(self, soup, html_content):
         """
         Detect if the page likely requires JavaScript rendering.
-        
+
+        Works on an already-parsed soup so the HTML is only parsed once
+        per page; the raw HTML is only scanned as a last resort.
+
         Returns True if the page likely needs JavaScript to load content.
         """
-        # Look for common JavaScript frameworks
-        js_framework_patterns = [
-            r'react', r'vue', r'angular', r'next.js', r'nuxt',
-            r'data-react', r'ng-app', r'v-for',
-            r'\_\_NEXT_DATA\_\_', r'window.__NUXT__'
-        ]
-        
-        # Look for content that's likely loaded via JS
-        js_content_patterns = [
-            r'<div id="app">\s*</div>',
-            r'<div id="root">\s*</div>',
-            r'getElementById\(.+?\)\.innerHTML',
-            r'document\.write\(',
-            r'display:\s*none;.+?[\'"]initial[\'"]'
-        ]
-        
-        # Check if the body has minimal content (potential JS loading)
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Cheap test first: a body with substantial text was rendered
+        # server-side, so skip the expensive regex scans entirely
         body = soup.find('body')
-        
-        if body and len(body.get_text(strip=True)) < 100:
-            # Look for specific script tags that suggest client-side rendering
+        if body and len(body.get_text(strip=True)) >= 100:
+            return False
+
+        if body:
+            # Look for script tags that suggest client-side rendering.
+            # Concatenating the script bodies and src attributes means the
+            # framework regex runs twice in total rather than twice per tag
             scripts = soup.find_all('script')
-            for script in scripts:
-                # Check script content or src attribute
-                if script.string:
-                    for pattern in js_framework_patterns:
-                        if re.search(pattern, script.string, re.I):
-                            return True
-                if script.get('src'):
-                    for pattern in js_framework_patterns:
-                        if re.search(pattern, script['src'], re.I):
-                            return True
-        
-        # Check for patterns in the entire HTML
-        for pattern in js_framework_patterns + js_content_patterns:
-            if re.search(pattern, html_content, re.I):
+            script_text = '\n'.join(script.string for script in scripts if script.string)
+            script_srcs = '\n'.join(script.get('src', '') for script in scripts)
+            if _JS_FRAMEWORK_RE.search(script_text) or _JS_FRAMEWORK_RE.search(script_srcs):
                 return True
-                
+
+        # Check for patterns in the entire HTML
+        if _JS_FRAMEWORK_RE.search(html_content) or _JS_CONTENT_RE.search(html_content):
+            return True
+
         return False
     
     def get_page_content(self, url):
-        """Get the page content, automatically choosing between requests and Selenium."""
+        """
+        Get the page content, automatically choosing between requests and Selenium.
+
+        Returns the raw HTML, or None if the page could not be fetched.
+        """
         # First try with regular requests
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                html_content = response.text
-                
-                # Check if content might need JavaScript rendering
-                if self.detect_javascript_content(html_content):
-                    logger.info(f"Detected JavaScript-heavy content at {url}, trying Selenium")
-                    
-                    # Initialize Selenium if not already done
-                    if not self.tried_selenium and self.initialize_selenium():
+            # Stream so JS detection can run on the first chunk: if Selenium
+            # is going to re-render the page anyway, the rest of the body is
+            # never downloaded
+            response = self.session.get(url, stream=True, timeout=10)
+            try:
+                if response.status_code != 200:
+                    logger.warning(f"Failed to fetch {url}: Status code {response.status_code}")
+                    return None
+
+                # Decode explicitly: response.text falls back to chardet-style
+                # detection (a full pass over the body) when the header has no
+                # charset, which is wasted work on typical UTF-8 pages
+                encoding = response.encoding or 'utf-8'
+                body_iter = response.iter_content(chunk_size=65536)
+                head = next(body_iter, b'')
+
+                # Check if content might need JavaScript rendering, but only
+                # while the result can still matter: after the one Selenium
+                # attempt (successful or not) the scan is wasted work. The
+                # first 64 KB is enough to see the head and opening body.
+                if not self.tried_selenium:
+                    head_html = head.decode(encoding, errors='replace')
+                    if self.detect_javascript_content(BeautifulSoup(head_html, 'lxml'), head_html):
+                        logger.info(f"Detected JavaScript-heavy content at {url}, trying Selenium")
                         self.tried_selenium = True
-                        try:
-                            self.driver.get(url)
-                            time.sleep(3)  # Wait for JavaScript to render
-                            return self.driver.page_source
-                        except Exception as e:
-                            logger.error(f"Selenium error for {url}: {e}")
-                            # Fall back to regular requests content
-                            return html_content
-                    else:
-                        logger.warning("Could not initialize Selenium, using regular requests content")
-                        return html_content
-                else:
-                    return html_content
-            else:
-                logger.warning(f"Failed to fetch {url}: Status code {response.status_code}")
-                return None
+
+                        # Initialize Selenium if not already done
+                        if self.initialize_selenium():
+                            try:
+                                return self.render_with_selenium(url)
+                            except Exception as e:
+                                logger.error(f"Selenium error for {url}: {e}")
+                                # Fall through to the regular requests content
+                        else:
+                            logger.warning("Could not initialize Selenium, using regular requests content")
+
+                # Pull in the rest of the body and decode it in one piece so
+                # multi-byte characters split across chunks survive
+                return b''.join([head, *body_iter]).decode(encoding, errors='replace')
+            finally:
+                response.close()
         except Exception as e:
             logger.error(f"Request error for {url}: {e}")
-            
+
             # Try with Selenium as fallback if regular request failed
-            if not self.tried_selenium and self.initialize_selenium():
+            if not self.tried_selenium:
                 self.tried_selenium = True
-                try:
-                    self.driver.get(url)
-                    time.sleep(3)  # Wait for JavaScript to render
-                    return self.driver.page_source
-                except Exception as se:
-                    logger.error(f"Selenium fallback error for {url}: {se}")
-            
+                if self.initialize_selenium():
+                    try:
+                        return self.render_with_selenium(url)
+                    except Exception as se:
+                        logger.error(f"Selenium fallback error for {url}: {se}")
+
             return None
-    
+
     def extract_text(self, html_content):
-        """Extract all text content from HTML."""
-        if not html_content:
-            return ""
-            
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Remove script and style elements
-        for script_or_style in soup(['script', 'style', 'noscript', 'iframe', 'svg', 'img']):
-            script_or_style.decompose()
-        
-        # Get text and normalize whitespace
-        text = soup.get_text(separator=' ')
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
-    
+        """Extract all text content from raw HTML."""
+        return _extract_text(html_content)
+
     def extract_links(self, html_content):
-        """Extract all links from HTML content."""
-        if not html_content:
-            return []
-            
-        soup = BeautifulSoup(html_content, 'html.parser')
-        links = []
-        
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            # Skip anchors, javascript, mailto, etc.
-            if href.startswith('#') or href.startswith('javascript:') or href.startswith('mailto:') or href.startswith('tel:'):
-                continue
-                
-            full_url = self.normalize_url(href)
-            # Only include links within the same domain
-            if self.is_same_domain(full_url):
-                links.append(full_url)
-        
-        return links
+        """Extract all same-domain links from raw HTML."""
+        return _extract_links(html_content, self.base_url, self.base_netloc)
     
     def save_to_csv(self, url, content):
         """Append URL and content to the CSV file."""
-        with open(self.output_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([url, content])
+        self._csv_writer.writerow([url, content])
     
+    def _collect_parsed(self, pending, block=False):
+        """
+        Harvest finished parse futures: write the text to CSV and enqueue
+        newly discovered links.
+
+        Args:
+            pending (dict): Maps in-flight futures to their URLs.
+            block (bool): Wait for at least one future instead of only
+                collecting those already done.
+        """
+        if not pending:
+            return
+
+        if block:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        else:
+            done = [future for future in pending if future.done()]
+
+        for future in done:
+            url = pending.pop(future)
+            try:
+                text_content, links = future.result()
+            except Exception as e:
+                logger.error(f"Parse error for {url}: {e}")
+                continue
+
+            self.save_to_csv(url, text_content)
+
+            # Batch the enqueue: one C-level set difference against queued,
+            # then a membership filter for visited (which may be a Bloom
+            # filter, so plain difference is not available)
+            new_links = set(links) - self.queued
+            new_links = {link for link in new_links if link not in self.visited_urls}
+            if new_links:
+                self.queue.extend(new_links)
+                self.queued |= new_links
+
     def scrape(self, max_pages=None):
         """
         Main scraping function.
-        
+
+        Fetches stay on the main thread (politeness delay included) while the
+        CPU-bound parsing of each fetched page runs in the worker-process
+        pool, so the next fetch overlaps with in-flight parses.
+
         Args:
             max_pages (int, optional): Maximum number of pages to scrape. None for unlimited.
         """
         page_count = 0
-        
+        pending = {}  # future -> url for pages still being parsed
+
         try:
-            while self.queue and (max_pages is None or page_count < max_pages):
-                # Get the next URL from the queue
-                url = self.queue.pop(0)
-                
+            while max_pages is None or page_count < max_pages:
+                if not self.queue:
+                    if not pending:
+                        break
+                    # The queue may refill once an in-flight parse reports
+                    # its links, so wait for one before giving up
+                    self._collect_parsed(pending, block=True)
+                    continue
+
+                # Get the next URL from the queue; drop it from the queued
+                # set so that only holds what is actually still in the queue
+                url = self.queue.popleft()
+                self.queued.discard(url)
+
                 # Skip if already visited or if robots.txt disallows
                 if url in self.visited_urls or (self.robot_parser_completed and not self.can_fetch(url)):
                     continue
-                    
+
                 logger.info(f"Scraping {url}")
                 self.visited_urls.add(url)
-                
+
                 # Add a random delay between requests
                 time.sleep(random.uniform(self.delay[0], self.delay[1]))
-                
+
                 # Get page content with smart detection
                 html_content = self.get_page_content(url)
                 if html_content:
-                    # Extract text and save to CSV
-                    text_content = self.extract_text(html_content)
-                    self.save_to_csv(url, text_content)
-                    
-                    # Extract links and add to queue
-                    links = self.extract_links(html_content)
-                    for link in links:
-                        if link not in self.visited_urls and link not in self.queue:
-                            self.queue.append(link)
-                
+                    # Parse in a worker process; results are collected below
+                    future = self._pool.submit(_parse_page, html_content, self.base_url, self.base_netloc)
+                    pending[future] = url
+
                 page_count += 1
                 logger.info(f"Completed {page_count} pages. Queue size: {len(self.queue)}")
-        
+
+                # Harvest whatever finished parsing while we were fetching
+                self._collect_parsed(pending)
+
+            # Queue exhausted or page limit reached; finish in-flight parses
+            while pending:
+                self._collect_parsed(pending, block=True)
+
         finally:
+            self._pool.shutdown()
+            self._csv_fh.close()
+            self.session.close()
+
             # Clean up Selenium driver if it was used
             if self.driver:
                 self.driver.quit()
                 logger.info("Selenium WebDriver closed")
-            
+
+            logger.info(f"Scraping completed. Scraped {page_count} pages. Data saved to {self.output_file}")
+
+    async def scrape_async(self, max_pages=None, concurrency=8):
+        """
+        Concurrent version of scrape() using aiohttp.
+
+        Keeps up to `concurrency` requests in flight while still applying the
+        politeness delay before each fetch. CPU-bound parsing runs in the
+        worker-process pool so it overlaps with in-flight fetches; CSV writes and queue
+        updates stay on the event loop. JavaScript-heavy pages are kept as
+        fetched rather than re-rendered, since the Selenium driver cannot be
+        shared across concurrent workers.
+
+        Args:
+            max_pages (int, optional): Maximum number of pages to scrape. None for unlimited.
+            concurrency (int): Maximum number of requests in flight at once.
+        """
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        url_queue = asyncio.Queue()
+        for url in self.queue:
+            url_queue.put_nowait(url)
+        self.queue.clear()
+
+        page_count = 0
+        started_count = 0  # pages whose fetch slot is already reserved
+        # bound in-flight requests to stay polite to the single target host
+        in_flight = asyncio.Semaphore(concurrency)
+        timeout = aiohttp.ClientTimeout(total=10)
+
+        async def worker(session):
+            nonlocal page_count, started_count
+            while True:
+                url = await url_queue.get()
+                try:
+                    self.queued.discard(url)
+                    if url in self.visited_urls or (self.robot_parser_completed and not self.can_fetch(url)):
+                        continue
+                    # Reserve the page slot before fetching - no await between
+                    # check and increment, so concurrent workers can't push
+                    # the crawl past max_pages
+                    if max_pages is not None and started_count >= max_pages:
+                        continue
+                    started_count += 1
+
+                    logger.info(f"Scraping {url}")
+                    self.visited_urls.add(url)
+
+                    async with in_flight:
+                        # Add a random delay between requests
+                        await asyncio.sleep(random.uniform(self.delay[0], self.delay[1]))
+                        try:
+                            async with session.get(url, timeout=timeout) as response:
+                                if response.status != 200:
+                                    logger.warning(f"Failed to fetch {url}: Status code {response.status}")
+                                    continue
+                                html_content = await response.text()
+                        except Exception as e:
+                            logger.error(f"Request error for {url}: {e}")
+                            continue
+
+                    # Guard the parse like _collect_parsed does: a bad page
+                    # must not kill the worker (and with it the whole crawl)
+                    try:
+                        text_content, links = await loop.run_in_executor(
+                            self._pool, _parse_page, html_content, self.base_url, self.base_netloc)
+                    except Exception as e:
+                        logger.error(f"Parse error for {url}: {e}")
+                        continue
+
+                    self.save_to_csv(url, text_content)
+
+                    new_links = set(links) - self.queued
+                    new_links = {link for link in new_links if link not in self.visited_urls}
+                    self.queued |= new_links
+                    for link in new_links:
+                        url_queue.put_nowait(link)
+
+                    page_count += 1
+                    logger.info(f"Completed {page_count} pages. Queue size: {url_queue.qsize()}")
+                finally:
+                    url_queue.task_done()
+
+        connector = aiohttp.TCPConnector(limit_per_host=concurrency, limit=64)
+        try:
+            async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
+                workers = [asyncio.ensure_future(worker(session)) for _ in range(concurrency)]
+                await url_queue.join()
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            self._pool.shutdown()
+            self._csv_fh.close()
             logger.info(f"Scraping completed. Scraped {page_count} pages. Data saved to {self.output_file}")
 
 if __name__ == "__main__":
@@ -289,6 +627,8 @@ if __name__ == "__main__":
     parser.add_argument("--delay-min", type=float, default=1, help="Minimum delay between requests in seconds")
     parser.add_argument("--delay-max", type=float, default=3, help="Maximum delay between requests in seconds")
     parser.add_argument("--ignore-robots", action="store_true", help="Ignore robots.txt rules")
+    parser.add_argument("--concurrency", "-c", type=int, default=None,
+                        help="Fetch pages concurrently with this many requests in flight (uses aiohttp)")
     parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], 
                         help="Set the logging level")
     
@@ -304,4 +644,7 @@ if __name__ == "__main__":
         respect_robots=not args.ignore_robots
     )
     
-    scraper.scrape(max_pages=args.max_pages)
+    if args.concurrency:
+        asyncio.run(scraper.scrape_async(max_pages=args.max_pages, concurrency=args.concurrency))
+    else:
+        scraper.scrape(max_pages=args.max_pages)
@@ -0,0 +1,47 @@
+import pytest
+
+import smart_web_scraper as sws
+
+# Page with head text, scripts to strip, and adjacent inline elements:
+# the extractors must keep the title and keep word boundaries between tags
+PAGE = (
+    '<html><head><title>My Title</title><script>var x = 1;</script></head>'
+    '<body><p>Hello world</p>'
+    '<a href="/a">x</a><a href="/b">f</a><a href="#top">skip</a>'
+    '<style>p { color: red; }</style></body></html>'
+)
+EXPECTED_TEXT = 'My Title Hello world x f'
+EXPECTED_LINKS = ['http://example.com/a', 'http://example.com/b']
+
+BASE_URL = 'http://example.com'
+BASE_NETLOC = 'example.com'
+
+
+def parser_paths():
+    """The available parser paths: selectolax (if installed) and lxml."""
+    paths = [pytest.param(False, id='lxml')]
+    if sws.LexborHTMLParser is not None:
+        paths.append(pytest.param(True, id='selectolax'))
+    return paths
+
+
+@pytest.fixture(params=parser_paths())
+def parser_path(request, monkeypatch):
+    """Force the lxml fallback path unless the param asks for selectolax."""
+    if not request.param:
+        monkeypatch.setattr(sws, 'LexborHTMLParser', None)
+    return request.param
+
+
+def test_extract_text(parser_path):
+    assert sws._extract_text(PAGE) == EXPECTED_TEXT
+
+
+def test_extract_links(parser_path):
+    assert sws._extract_links(PAGE, BASE_URL, BASE_NETLOC) == EXPECTED_LINKS
+
+
+def test_parse_page(parser_path):
+    text, links = sws._parse_page(PAGE, BASE_URL, BASE_NETLOC)
+    assert text == EXPECTED_TEXT
+    assert links == EXPECTED_LINKS